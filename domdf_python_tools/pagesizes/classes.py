@@ -82,11 +82,10 @@ class BaseSize(namedtuple("__BaseSize", "width, height")):
 		:param height: The page height.
 		"""
 
-		return super().__new__(
-				cls,
-				cls._unit(width),
-				cls._unit(height),
-				)
+		# Construct the unit values directly rather than via ``Unit.__call__``,
+		# and bypass the namedtuple's generated ``__new__``.
+		unit_type = cls._unit.__class__
+		return tuple.__new__(cls, (unit_type(width), unit_type(height)))
 
 	def __str__(self) -> str:
 		return f"{self.__class__.__name__}(width={_rounders(self.width, '0')}, height={_rounders(self.height, '0')})"
@@ -100,11 +99,16 @@ class BaseSize(namedtuple("__BaseSize", "width, height")):
 		:param size: The size, in point, to convert from.
 
 		:rtype: A subclass of :class:`~domdf_python_tools.pagesizes.classes.BaseSize`
-		"""  # noqa: D400
 
-		assert isinstance(size, PageSize)
+		.. versionchanged:: 3.5.0
+
+			``size`` may be any ``(width, height)`` sequence.
+			Previously it had to be a :class:`~.PageSize`.
+		"""  # noqa: D400
 
-		return cls(cls._unit.from_pt(size[0]), cls._unit.from_pt(size[1]))
+		unit_type = cls._unit.__class__
+		in_pt = cls._unit._in_pt
+		return tuple.__new__(cls, (unit_type(size[0] / in_pt), unit_type(size[1] / in_pt)))
 
 	@classmethod
 	def from_size(cls, size: Tuple[AnyNumber, AnyNumber]) -> "BaseSize":
@@ -119,29 +123,29 @@ class BaseSize(namedtuple("__BaseSize", "width, height")):
 		Returns whether the page is in the landscape orientation.
 		"""
 
-		return self.width >= self.height
+		return self[0] >= self[1]
 
 	def is_portrait(self) -> bool:
 		"""
 		Returns whether the page is in the portrait orientation.
 		"""
 
-		return self.width < self.height
+		return self[0] < self[1]
 
 	def is_square(self) -> bool:
 		"""
 		Returns whether the given pagesize is square.
 		"""
 
-		return self.width == self.height
+		return self[0] == self[1]
 
 	def landscape(self) -> "BaseSize":
 		"""
 		Returns the pagesize in landscape orientation.
 		"""
 
-		if self.is_portrait():
-			return self.__class__(self.height, self.width)
+		if self[0] < self[1]:
+			return self._swap()
 		else:
 			return self
 
@@ -150,11 +154,15 @@ class BaseSize(namedtuple("__BaseSize", "width, height")):
 		Returns the pagesize in portrait orientation.
 		"""
 
-		if self.is_landscape():
-			return self.__class__(self.height, self.width)
+		if self[0] >= self[1]:
+			return self._swap()
 		else:
 			return self
 
+	def _swap(self) -> "BaseSize":
+		# The values are already instances of the correct unit, so skip ``__new__``.
+		return tuple.__new__(self.__class__, (self[1], self[0]))
+
 	def to_pt(self) -> "PageSize":
 		"""
 		Returns the page size in point.
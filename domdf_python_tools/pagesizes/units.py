@@ -37,6 +37,7 @@ Provides a variety of units for use with pagesizes.
 #
 
 # stdlib
+import functools
 import math
 from decimal import ROUND_HALF_UP, Decimal
 from typing import SupportsFloat, Union
@@ -62,8 +63,13 @@ __all__ = [
 		]
 
 
+@functools.lru_cache()
+def _quantize_exponent(round_format: str) -> Decimal:
+	return Decimal(str(round_format))
+
+
 def _rounders(val_to_round: Union[str, int, float, Decimal], round_format: str) -> Decimal:
-	return Decimal(Decimal(val_to_round).quantize(Decimal(str(round_format)), rounding=ROUND_HALF_UP))
+	return Decimal(val_to_round).quantize(_quantize_exponent(round_format), rounding=ROUND_HALF_UP)
 
 
 @prettify_docstrings
@@ -46,17 +46,19 @@ Functions for paths and files.
 # stdlib
 import contextlib
 import filecmp
-import fnmatch
+import functools
 import gzip
+import itertools
 import json
 import os
 import pathlib
+import re
 import shutil
 import stat
 import sys
 import tempfile
 import urllib.parse
-from collections import defaultdict, deque
+from collections import defaultdict
 from operator import methodcaller
 from typing import (
 		IO,
@@ -68,7 +70,9 @@ from typing import (
 		Iterator,
 		List,
 		Optional,
+		Pattern,
 		Sequence,
+		Tuple,
 		Type,
 		TypeVar,
 		Union
@@ -97,6 +101,7 @@ __all__ = [
 		"_PP",
 		"traverse_to_file",
 		"matchglob",
+		"compile_glob",
 		"unwanted_dirs",
 		"TemporaryPathPlus",
 		"sort_paths",
@@ -140,6 +145,9 @@ A list of directories which will likely be unwanted when searching directory tre
 .. versionchanged:: 3.2.0  Added ``.nox`` (https://nox.thea.codes/)
 """
 
+# Used by iterchildren when the default is given, to avoid building a new set on every call.
+_unwanted_dirs_set = frozenset(unwanted_dirs)
+
 
 def append(var: str, filename: PathLike, **kwargs) -> int:
 	"""
@@ -192,13 +200,13 @@ def copytree(
 		glob-style patterns.
 	"""
 
-	for item in os.listdir(src):
-		s = os.path.join(src, item)
-		d = os.path.join(dst, item)
-		if os.path.isdir(s):
-			shutil.copytree(s, d, symlinks, ignore)
-		else:
-			shutil.copy2(s, d)
+	with os.scandir(src) as it:
+		for entry in it:
+			d = os.path.join(dst, entry.name)
+			if entry.is_dir():
+				shutil.copytree(entry.path, d, symlinks, ignore)
+			else:
+				shutil.copy2(entry.path, d)
 
 	return dst
 
@@ -235,13 +243,24 @@ def maybe_make(directory: PathLike, mode: int = 0o777, parents: bool = False):
 
 	"""
 
-	if not isinstance(directory, pathlib.Path):
-		directory = pathlib.Path(directory)
-
+	# Optimistically create the directory; only fall back to pathlib if a parent is missing.
 	try:
-		directory.mkdir(mode, parents, exist_ok=True)
+		os.mkdir(directory, mode)
+	except FileNotFoundError:
+		if not parents:
+			raise
+
+		try:
+			pathlib.Path(directory).mkdir(mode, parents=True, exist_ok=True)
+		except FileExistsError:
+			pass
 	except FileExistsError:
 		pass
+	except OSError:
+		# As with pathlib, the operating system may report errors such as EACCES or EROFS
+		# in preference to EEXIST, so these are only raised if the directory does not exist.
+		if not os.path.isdir(directory):
+			raise
 
 
 def parent_path(path: PathLike) -> pathlib.Path:
@@ -293,12 +312,12 @@ def relpath(path: PathLike, relative_to: Optional[PathLike] = None) -> pathlib.P
 	abs_path = path.absolute()
 
 	if relative_to is None:
-		relative_to = pathlib.Path().absolute()
+		relative_to = pathlib.Path.cwd()
+	else:
+		if not isinstance(relative_to, pathlib.Path):
+			relative_to = pathlib.Path(relative_to)
 
-	if not isinstance(relative_to, pathlib.Path):
-		relative_to = pathlib.Path(relative_to)
-
-	relative_to = relative_to.absolute()
+		relative_to = relative_to.absolute()
 
 	try:
 		return abs_path.relative_to(relative_to)
@@ -330,12 +349,12 @@ def clean_writer(string: str, fp: IO) -> None:
 	:param fp:
 	"""
 
-	# this package
-	from domdf_python_tools.stringlist import StringList
+	# Strip trailing whitespace from each line, and ensure a single newline at the end of the file.
+	string = '\n'.join([line.rstrip() for line in string.split('\n')]).rstrip('\n')
+	if string:
+		string += '\n'
 
-	buffer = StringList(string)
-	buffer.blankline(ensure_single=True)
-	fp.write(str(buffer))
+	fp.write(string)
 
 
 def make_executable(filename: PathLike) -> None:
@@ -345,11 +364,8 @@ def make_executable(filename: PathLike) -> None:
 	:param filename:
 	"""
 
-	if not isinstance(filename, pathlib.Path):
-		filename = pathlib.Path(filename)
-
-	st = os.stat(str(filename))
-	os.chmod(str(filename), st.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+	st = os.stat(filename)
+	os.chmod(filename, st.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
 
 
 @contextlib.contextmanager
@@ -363,7 +379,7 @@ def in_directory(directory: PathLike):
 
 	oldwd = os.getcwd()
 	try:
-		os.chdir(str(directory))
+		os.chdir(directory)
 		yield
 	finally:
 		os.chdir(oldwd)
@@ -461,10 +477,7 @@ class PathPlus(pathlib.Path):
 
 		"""
 
-		try:
-			self.mkdir(mode, parents, exist_ok=True)
-		except FileExistsError:
-			pass
+		maybe_make(self, mode, parents)
 
 	def append_text(
 			self,
@@ -872,22 +885,41 @@ class PathPlus(pathlib.Path):
 			return
 
 		if exclude_dirs is None:
-			exclude_dirs = ()
+			exclude_dirs = frozenset()
+		elif exclude_dirs is unwanted_dirs:
+			exclude_dirs = _unwanted_dirs_set
+		else:
+			exclude_dirs = frozenset(exclude_dirs)
+		if not exclude_dirs.isdisjoint(self.parts):
+			return
 
 		if match and not os.path.isabs(match) and self.is_absolute():
 			match = (self / match).as_posix()
 
-		file: _PP
-		for file in self.iterdir():
-			parts = file.parts
-			if any(d in parts for d in exclude_dirs):
-				continue
+		regex = None if match is None else _compile_glob(match, matchcase)
+
+		# Walk the tree with os.scandir, pruning excluded directories before descending into them.
+		# Each directory on the stack carries its path in the form used by the glob matcher,
+		# so entries are matched without being parsed, and path objects are only constructed
+		# for the entries which are yielded.
+		stack: List[Tuple[Iterator[os.DirEntry], str]] = [(_scandir(self), _join_glob_filename(self, matchcase))]
+		while stack:
+			entries, prefix = stack[-1]
+			for entry in entries:
+				name = entry.name
+				if name in exclude_dirs:
+					continue
 
-			if match is None or (match is not None and matchglob(file, match, matchcase)):
-				yield file
+				joined = f"{prefix}{name if matchcase else os.path.normcase(name)}\0"
 
-			if file.is_dir():
-				yield from file.iterchildren(exclude_dirs, match)
+				if regex is None or regex.fullmatch(joined) is not None:
+					yield self.__class__(entry.path)
+
+				if entry.is_dir():
+					stack.append((_scandir(entry.path), joined))
+					break
+			else:
+				stack.pop()
 
 	@classmethod
 	def from_uri(cls: Type[_PP], uri: str) -> _PP:
@@ -1017,6 +1049,12 @@ class WindowsPathPlus(PathPlus, pathlib.PureWindowsPath):
 		raise NotImplementedError("Path.is_mount() is unsupported on this system")
 
 
+def _scandir(directory: PathLike) -> Iterator[os.DirEntry]:
+	# Read the whole listing up front so the directory handle isn't held open while recursing.
+	with os.scandir(directory) as it:
+		return iter(list(it))
+
+
 def traverse_to_file(base_directory: _P, *filename: PathLike, height: int = -1) -> _P:
 	r"""
 	Traverse the parents of the given directory until the desired file is found.
@@ -1035,8 +1073,10 @@ def traverse_to_file(base_directory: _P, *filename: PathLike, height: int = -1)
 		if height > 0 and ((level - 1) > height):
 			break
 
+		# Check with plain strings to avoid constructing a path object for every candidate.
+		directory_str = os.fspath(directory)
 		for file in filename:
-			if (directory / file).is_file():
+			if os.path.isfile(os.path.join(directory_str, file)):
 				return directory
 
 	raise FileNotFoundError(f"'{filename[0]!s}' not found in {base_directory}")
@@ -1060,57 +1100,211 @@ def matchglob(filename: PathLike, pattern: str, matchcase: bool = True) -> bool:
 	.. versionchanged:: 2.5.0  Added the ``matchcase`` option.
 	"""
 
-	match_func = fnmatch.fnmatchcase if matchcase else fnmatch.fnmatch
+	return _compile_glob(pattern, matchcase).fullmatch(_join_glob_filename(filename, matchcase)) is not None
+
 
-	filename = PathPlus(filename)
+def compile_glob(pattern: str, matchcase: bool = True) -> Callable[[PathLike], bool]:
+	"""
+	Compile the given glob pattern into a function which returns whether a filename matches the glob.
 
-	pattern_parts = deque(pathlib.PurePath(pattern).parts)
-	filename_parts = deque(filename.parts)
+	This is equivalent to calling :func:`~.matchglob` with the same ``pattern`` and ``matchcase``
+	for each filename, but the pattern is only processed once.
 
-	if not pattern_parts[-1]:
-		pattern_parts.pop()
+	.. versionadded:: 3.5.0
 
-	while True:
-		if not pattern_parts and not filename_parts:
-			return True
-		elif not pattern_parts and filename_parts:
-			# Pattern exhausted but still filename elements
-			return False
+	:param pattern: A pattern structured like a filesystem path, in the format taken by :func:`~.matchglob`.
+	:param matchcase: Whether the filename's case should match the pattern.
+	"""
+
+	regex = _compile_glob(pattern, matchcase)
+
+	def matcher(filename: PathLike) -> bool:
+		return regex.fullmatch(_join_glob_filename(filename, matchcase)) is not None
+
+	return matcher
+
+
+def _join_glob_filename(filename: PathLike, matchcase: bool = True) -> str:
+	if not matchcase:
+		filename_parts = map(os.path.normcase, pathlib.PurePath(filename).parts)
+	else:
+		filename_parts = pathlib.PurePath(filename).parts
+
+	# Each path element is terminated with a null byte, which cannot appear in a filename.
+	return ''.join(f"{part}\0" for part in filename_parts)
 
-		pattern_part = pattern_parts.popleft()
 
-		if pattern_part == "**" and not filename_parts:
-			return True
+@functools.lru_cache()
+def _compile_glob(pattern: str, matchcase: bool = True) -> Pattern[str]:
+	"""
+	Compile the given glob pattern (in the format taken by :func:`~.matchglob`) to a regular expression.
+
+	The expression matches against the elements of a path, each terminated with a null byte.
+
+	:param pattern:
+	:param matchcase: Whether the filename's case should match the pattern.
+	"""
+
+	# Split the pattern into runs of elements separated by ``**``, collapsing consecutive ``**`` elements.
+	runs: List[List[str]] = [[]]
+
+	for part in pathlib.PurePath(pattern).parts:
+		if part == "**":
+			if runs[-1] or len(runs) == 1:
+				runs.append([])
 		else:
-			filename_part = filename_parts.popleft()
+			if not matchcase:
+				part = os.path.normcase(part)
+			runs[-1].append(part)
 
-		if pattern_part == "**":
-			if not pattern_parts:
-				return True
+	group_numbers = itertools.count()
 
-			while pattern_part == "**":
-				if not pattern_parts:
-					return True
+	# A ``**`` also matches the end of a path which is exhausted before the ``**``,
+	# so the path may instead match everything before any of the ``**`` elements.
+	alternatives = [_translate_glob_runs(runs, group_numbers)]
+	alternatives.extend(_translate_glob_runs(runs[:idx], group_numbers) for idx in range(1, len(runs)))
 
-				pattern_part = pattern_parts.popleft()
+	return re.compile('|'.join(alternatives))
 
-			if pattern_parts and not filename_parts:
-				# Filename must match everything after **
-				return False
 
-			if match_func(filename_part, pattern_part):
-				continue
+def _translate_glob_runs(runs: List[List[str]], group_numbers: Iterator[int]) -> str:
+	"""
+	Translate runs of glob pattern elements, each separated from the next by ``**``, to a regular expression.
+
+	Each run before the last is matched at the first position it can be, using an atomic group
+	(emulated with a lookahead and a backreference). As each run matches a fixed number of elements
+	this does not prevent a match, and it avoids backtracking through every earlier ``**``.
+
+	:param runs:
+	:param group_numbers: Supplies unique numbers for the names of groups within the regular expression.
+	"""
+
+	def translate_run(run: List[str]) -> str:
+		return ''.join(_translate_glob_part(part, group_numbers) + '\0' for part in run)
+
+	regex = translate_run(runs[0])
+
+	for run in runs[1:-1]:
+		group = f"g{next(group_numbers)}"
+		regex += f"(?=(?P<{group}>(?:[^\0]*\0)*?{translate_run(run)}))(?P={group})"
+
+	if len(runs) > 1:
+		regex += "(?:[^\0]*\0)*" + translate_run(runs[-1])
+
+	return f"(?:{regex})"
+
+
+def _translate_glob_part(part: str, group_numbers: Iterator[int]) -> str:
+	"""
+	Translate a single element of a glob pattern to a regular expression.
+
+	This mirrors :func:`fnmatch.translate`, except that wildcards do not match the null byte separating elements.
+
+	:param part:
+	:param group_numbers: Supplies unique numbers for the names of groups within the regular expression.
+	"""
+
+	star = object()
+	i, n = 0, len(part)
+	res: List[Any] = []
+
+	while i < n:
+		c = part[i]
+		i += 1
+
+		if c == '*':
+			# Collapse consecutive wildcards
+			if not res or res[-1] is not star:
+				res.append(star)
+		elif c == '?':
+			res.append("[^\0]")
+		elif c == '[':
+			j = i
+			if j < n and part[j] == '!':
+				j += 1
+			if j < n and part[j] == ']':
+				j += 1
+			while j < n and part[j] != ']':
+				j += 1
+
+			if j >= n:
+				res.append("\\[")
 			else:
-				while not match_func(filename_part, pattern_part):
-					if not filename_parts:
-						return False
+				if '-' not in part[i:j]:
+					stuff = part[i:j].replace('\\', "\\\\")
+				else:
+					# As in fnmatch.translate, remove empty ranges (which are invalid in regular expressions)
+					# and escape hyphens which do not create ranges.
+					chunks = []
+					k = i + 2 if part[i] == '!' else i + 1
+					while True:
+						k = part.find('-', k, j)
+						if k < 0:
+							break
+						chunks.append(part[i:k])
+						i = k + 1
+						k = k + 3
+
+					chunk = part[i:j]
+					if chunk:
+						chunks.append(chunk)
+					else:
+						chunks[-1] += '-'
+
+					for k in range(len(chunks) - 1, 0, -1):
+						if chunks[k - 1][-1] > chunks[k][0]:
+							chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+							del chunks[k]
+
+					stuff = '-'.join(s.replace('\\', "\\\\").replace('-', "\\-") for s in chunks)
+
+				stuff = re.sub(r"([&~|])", r"\\\1", stuff)
+				i = j + 1
+
+				if not stuff:
+					# Empty range: never match.
+					res.append("(?!)")
+				elif stuff == '!':
+					# Negated empty range: match any character.
+					res.append("[^\0]")
+				else:
+					if stuff[0] == '!':
+						# Wildcards must not match the null byte. Once it is added a leading ``]``
+						# is no longer first in the class, so it is escaped to stop it closing the class.
+						rest = stuff[1:]
+						stuff = "^\0" + ('\\' + rest if rest.startswith(']') else rest)
+					elif stuff[0] in ('^', '['):
+						stuff = '\\' + stuff
+
+					res.append(f"[{stuff}]")
+		else:
+			res.append(re.escape(c))
+
+	# As in fnmatch.translate, the text between two wildcards is matched by an atomic group
+	# (emulated with a lookahead and a backreference), which prevents exponential backtracking.
+	# The text before the first wildcard and after the last wildcard is matched as-is.
+	i, n = 0, len(res)
+	regex = []
+
+	while i < n and res[i] is not star:
+		regex.append(res[i])
+		i += 1
 
-					filename_part = filename_parts.popleft()
+	while i < n:
+		i += 1
 
-		elif match_func(filename_part, pattern_part):
-			continue
+		fixed = []
+		while i < n and res[i] is not star:
+			fixed.append(res[i])
+			i += 1
+
+		if i == n:
+			regex.append("[^\0]*" + ''.join(fixed))
 		else:
-			return False
+			group = f"g{next(group_numbers)}"
+			regex.append(f"(?=(?P<{group}>[^\0]*?{''.join(fixed)}))(?P={group})")
+
+	return ''.join(regex)
 
 
 class TemporaryPathPlus(tempfile.TemporaryDirectory):
@@ -67,6 +67,7 @@ Useful functions for terminal-based programs.
 import inspect
 import os
 import pprint
+import sys
 import textwrap
 from shutil import get_terminal_size
 from typing import IO, Optional
@@ -151,8 +152,14 @@ def overtype(
 	:param flush: If :py:obj:`True` the stream is forcibly flushed after printing.
 	"""  # noqa: D400
 
-	object0 = f"{CR}{objects[0]}"
-	objects = (object0, *objects[1:])
+	if file is None:
+		file = sys.stdout
+
+		if file is None:
+			# There is no stdout (e.g. under pythonw), in which case print() does nothing.
+			return
+
+	file.write(CR)
 	print(*objects, sep=sep, end=end, file=file, flush=flush)
 
 
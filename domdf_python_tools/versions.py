@@ -29,8 +29,7 @@ NamedTuple-like class to represent a version number.
 #
 
 # stdlib
-import re
-from typing import Dict, Generator, Iterable, Sequence, Tuple, Type, TypeVar, Union
+from typing import Dict, Iterable, Sequence, Tuple, Type, TypeVar, Union
 
 # 3rd party
 from typing_extensions import final
@@ -77,6 +76,8 @@ class Version(Tuple[int, int, int]):
 	.. versionadded:: 1.4.0
 	"""
 
+	_repr_fmt: str = "(major=%r, minor=%r, patch=%r)"
+
 	@property  # type: ignore
 	def major(self):  # noqa: D102
 		return self[0]
@@ -90,31 +91,28 @@ class Version(Tuple[int, int, int]):
 		return self[2]
 
 	def __new__(cls: Type[_V], major=0, minor=0, patch=0) -> _V:  # noqa: D102
-		t: _V = super().__new__(cls, (int(major), int(minor), int(patch)))  # type: ignore
-
-		return t
+		return tuple.__new__(cls, (int(major), int(minor), int(patch)))  # type: ignore
 
 	def __repr__(self) -> str:
 		"""
 		Return the representation of the version.
 		"""
 
-		repr_fmt = '(' + ", ".join(f"{name}=%r" for name in self._fields) + ')'
-		return self.__class__.__name__ + repr_fmt % self
+		return self.__class__.__name__ + self._repr_fmt % self
 
 	def __str__(self) -> str:
 		"""
 		Return version as a string.
 		"""
 
-		return 'v' + '.'.join(str(x) for x in self)  # pylint: disable=not-an-iterable
+		return f"v{self[0]}.{self[1]}.{self[2]}"
 
 	def __float__(self) -> float:
 		"""
 		Return the major and minor version number as a float.
 		"""
 
-		return float('.'.join(str(x) for x in self[:2]))
+		return float(f"{self[0]}.{self[1]}")
 
 	def __int__(self) -> int:
 		"""
@@ -157,7 +155,7 @@ class Version(Tuple[int, int, int]):
 		if other is NotImplemented:
 			return NotImplemented  # pragma: no cover
 		else:
-			return tuple(self) > other
+			return tuple.__gt__(self, other)
 
 	def __lt__(self, other) -> bool:
 		"""
@@ -171,7 +169,7 @@ class Version(Tuple[int, int, int]):
 		if other is NotImplemented:
 			return NotImplemented  # pragma: no cover
 		else:
-			return tuple(self) < other
+			return tuple.__lt__(self, other)
 
 	def __ge__(self, other) -> bool:
 		"""
@@ -185,7 +183,7 @@ class Version(Tuple[int, int, int]):
 		if other is NotImplemented:
 			return NotImplemented  # pragma: no cover
 		else:
-			return tuple(self)[:len(other)] >= other
+			return self[:len(other)] >= other
 
 	def __le__(self, other) -> bool:
 		"""
@@ -199,7 +197,7 @@ class Version(Tuple[int, int, int]):
 		if other is NotImplemented:
 			return NotImplemented  # pragma: no cover
 		else:
-			return tuple(self)[:len(other)] <= other
+			return self[:len(other)] <= other
 
 	@classmethod
 	def from_str(cls: Type[_V], version_string: str) -> _V:
@@ -279,7 +277,7 @@ class Version(Tuple[int, int, int]):
 		return cls(*(int(x) for x in tuple(iterable)[:3]))
 
 
-def _iter_string(version_string: str) -> Generator[int, None, None]:
+def _iter_string(version_string: str) -> Tuple[int, ...]:
 	"""
 	Iterate over the version elements from a string.
 
@@ -288,10 +286,10 @@ def _iter_string(version_string: str) -> Generator[int, None, None]:
 	:return: Iterable elements of the version.
 	"""
 
-	return (int(x) for x in re.split("[.,]", version_string))
+	return tuple(map(int, version_string.replace(',', '.').split('.')))
 
 
-def _iter_float(version_float: float) -> Generator[int, None, None]:
+def _iter_float(version_float: float) -> Tuple[int, ...]:
 	"""
 	Iterate over the version elements from a float.
 
@@ -308,11 +306,15 @@ def _prep_for_eq(other: Union[str, float, Version], ) -> Tuple[int, ...]:
 	Prepare 'other' for use in ``__eq__``, ``__le__``, ``__ge__``, ``__gt__``, and ``__lt__``.
 	"""
 
-	if isinstance(other, str):
-		return tuple(_iter_string(other))
-	elif isinstance(other, (Version, Sequence)):
-		return tuple(int(x) for x in other)
+	if isinstance(other, Version):
+		# Already a tuple of ints.
+		return tuple(other)
+	elif isinstance(other, str):
+		return _iter_string(other)
 	elif isinstance(other, (int, float)):
-		return tuple(_iter_float(other))
+		return _iter_float(other)
+	elif isinstance(other, (tuple, list, Sequence)):
+		# Check the concrete types first to avoid the slower ABC instance check.
+		return tuple(map(int, other))
 	else:  # pragma: no cover
 		return NotImplemented
@@ -194,6 +194,22 @@ def test_from_size(size: Tuple[int, int], expected: Unit, class_: Type[BaseSize]
 	assert class_.from_size(size) == expected
 
 
+@pytest.mark.parametrize(
+		"size, class_",
+		[
+				(PageSize(595, 842), Size_mm),
+				((595, 842), Size_mm),
+				([595, 842], Size_mm),
+				((72, 144), Size_inch),
+				((72, 144), PageSize),
+				],
+		)
+def test_from_pt(size: Tuple[float, float], class_: Type[BaseSize]):
+	converted = class_.from_pt(size)
+	assert type(converted) is class_
+	assert converted.to_pt() == PageSize(*size)
+
+
 @pytest.mark.parametrize(
 		"string, expects",
 		[
@@ -7,15 +7,13 @@ Test functions in paths.py
 """
 
 # stdlib
-import contextlib
 import os
 import pathlib
 import platform
 import shutil
 import sys
-from tempfile import TemporaryDirectory
 from textwrap import dedent
-from typing import Type
+from typing import Iterable, List, Tuple, Type
 
 # 3rd party
 import pytest
@@ -29,6 +27,7 @@ from domdf_python_tools.paths import (
 		PathPlus,
 		TemporaryPathPlus,
 		clean_writer,
+		compile_glob,
 		copytree,
 		in_directory,
 		matchglob,
@@ -37,45 +36,29 @@ from domdf_python_tools.paths import (
 		)
 
 
-def test_maybe_make(tmp_pathplus):
-	test_dir = tmp_pathplus / "maybe_make"
-
-	assert test_dir.exists() is False
-
-	# Maybe make the directory
-	paths.maybe_make(test_dir)
-
-	assert test_dir.exists()
-
-	# Maybe make the directory
-	paths.maybe_make(test_dir)
-
-	assert test_dir.exists()
-
-	# Delete the directory and replace with a file
-	test_dir.rmdir()
-	assert test_dir.exists() is False
-	test_dir.touch()
-	assert test_dir.exists()
-	assert test_dir.is_file()
-
-	paths.maybe_make(test_dir)
-	assert test_dir.exists()
-	assert test_dir.is_file()
+maybe_make_functions = pytest.mark.parametrize(
+		"maybe_make",
+		[
+				pytest.param(paths.maybe_make, id="function"),
+				pytest.param(lambda directory, **kwargs: paths.maybe_make(str(directory), **kwargs), id="string"),
+				pytest.param(PathPlus.maybe_make, id="PathPlus"),
+				]
+		)
 
 
-def test_maybe_make_pathplus(tmp_pathplus):
+@maybe_make_functions
+def test_maybe_make(tmp_pathplus, maybe_make):
 	test_dir = tmp_pathplus / "maybe_make"
 
 	assert test_dir.exists() is False
 
 	# Maybe make the directory
-	test_dir.maybe_make()
+	maybe_make(test_dir)
 
 	assert test_dir.exists()
 
 	# Maybe make the directory
-	test_dir.maybe_make()
+	maybe_make(test_dir)
 
 	assert test_dir.exists()
 
@@ -86,39 +69,13 @@ def test_maybe_make_pathplus(tmp_pathplus):
 	assert test_dir.exists()
 	assert test_dir.is_file()
 
-	test_dir.maybe_make()
-	assert test_dir.exists()
-	assert test_dir.is_file()
-
-
-def test_maybe_make_string(tmp_pathplus):
-	test_dir = tmp_pathplus / "maybe_make"
-
-	assert test_dir.exists() is False
-
-	# Maybe make the directory
-	paths.maybe_make(str(test_dir))
-
-	assert test_dir.exists()
-
-	# Maybe make the directory
-	paths.maybe_make(str(test_dir))
-
-	assert test_dir.exists()
-
-	# Delete the directory and replace with a file
-	test_dir.rmdir()
-	assert not test_dir.exists()
-	test_dir.touch()
-	assert test_dir.exists()
-	assert test_dir.is_file()
-
-	paths.maybe_make(str(test_dir))
+	maybe_make(test_dir)
 	assert test_dir.exists()
 	assert test_dir.is_file()
 
 
-def test_maybe_make_parents(tmp_pathplus):
+@maybe_make_functions
+def test_maybe_make_parents(tmp_pathplus, maybe_make):
 	test_dir = tmp_pathplus / "maybe_make" / "child1" / "child2"
 
 	assert test_dir.exists() is False
@@ -126,28 +83,33 @@ def test_maybe_make_parents(tmp_pathplus):
 	# Without parents=True should raise an error
 
 	with pytest.raises(FileNotFoundError):
-		paths.maybe_make(test_dir)
+		maybe_make(test_dir)
 
 	# Maybe make the directory
-	paths.maybe_make(test_dir, parents=True)
+	maybe_make(test_dir, parents=True)
 
 	assert test_dir.exists()
 
 
-def test_maybe_make_parents_pathplus(tmp_pathplus):
-	test_dir = tmp_pathplus / "maybe_make" / "child1" / "child2"
+@maybe_make_functions
+def test_maybe_make_other_error(tmp_pathplus, maybe_make, monkeypatch):
+	test_dir = tmp_pathplus / "maybe_make"
 
-	assert test_dir.exists() is False
+	def mkdir(*args, **kwargs):
+		raise PermissionError("Permission denied")
 
-	# Without parents=True should raise an error
+	monkeypatch.setattr(os, "mkdir", mkdir)
 
-	with pytest.raises(FileNotFoundError):
-		test_dir.maybe_make()
+	# The error is only raised if the directory doesn't already exist.
+	with pytest.raises(PermissionError, match="Permission denied"):
+		maybe_make(test_dir)
 
-	# Maybe make the directory
-	test_dir.maybe_make(parents=True)
+	monkeypatch.undo()
+	test_dir.mkdir()
+	monkeypatch.setattr(os, "mkdir", mkdir)
 
-	assert test_dir.exists()
+	maybe_make(test_dir)
+	assert test_dir.is_dir()
 
 
 def test_parent_path(tmp_pathplus):
@@ -200,6 +162,11 @@ def test_relpath_windows(relto, relpath):
 
 class TestCurrentDirOperations:
 
+	@pytest.fixture(autouse=True)
+	def _in_tmp_pathplus(self, tmp_pathplus: PathPlus):
+		with in_directory(tmp_pathplus):
+			yield
+
 	def test_append(self):
 		file = pathlib.Path("paths_append_test_file.txt")
 		file.write_text("initial content\n")
@@ -233,17 +200,6 @@ class TestCurrentDirOperations:
 		assert paths.read(str(file)) == "overwritten content"
 		file.unlink()
 
-	@classmethod
-	def teardown_class(cls):
-		for file in [
-				"paths_append_test_file.txt",
-				"paths_delete_test_file.txt",
-				"paths_read_test_file.txt",
-				"paths_write_test_file.txt",
-				]:
-			with contextlib.suppress(FileNotFoundError):
-				pathlib.Path(file).unlink()
-
 
 def test_clean_writer(tmp_pathplus):
 	tempfile = tmp_pathplus / "tmpfile.txt"
@@ -324,30 +280,27 @@ def test_pathplus_write_clean(tmp_pathplus, input_string, output_string):
 
 
 @not_pypy()
-def test_make_executable():
-	with TemporaryDirectory() as tmpdir:
-		tempfile = pathlib.Path(tmpdir) / "tmpfile.sh"
-		tempfile.touch()
+def test_make_executable(tmp_pathplus):
+	tempfile = pathlib.Path(tmp_pathplus) / "tmpfile.sh"
+	tempfile.touch()
 
-		paths.make_executable(tempfile)
+	paths.make_executable(tempfile)
 
-		assert os.access(tempfile, os.X_OK)
+	assert os.access(tempfile, os.X_OK)
 
-	with TemporaryDirectory() as tmpdir:
-		tempfile = pathlib.Path(tmpdir) / "tmpfile.sh"
-		tempfile.touch()
+	tempfile = pathlib.Path(tmp_pathplus) / "tmpfile_str.sh"
+	tempfile.touch()
 
-		paths.make_executable(str(tempfile))
+	paths.make_executable(str(tempfile))
 
-		assert os.access(str(tempfile), os.X_OK)
+	assert os.access(str(tempfile), os.X_OK)
 
-	with TemporaryDirectory() as tmpdir:
-		tempfile = PathPlus(tmpdir) / "tmpfile.sh"
-		tempfile.touch()
+	tempfile = tmp_pathplus / "tmpfile_pathplus.sh"
+	tempfile.touch()
 
-		tempfile.make_executable()
+	tempfile.make_executable()
 
-		assert os.access(tempfile, os.X_OK)
+	assert os.access(tempfile, os.X_OK)
 
 
 def test_instantiate_wrong_platform():
@@ -359,105 +312,52 @@ def test_instantiate_wrong_platform():
 			paths.WindowsPathPlus()
 
 
-def test_copytree(tmp_pathplus):
-	srcdir = tmp_pathplus / "src"
-	srcdir.mkdir()
+_copytree_files = ("root.txt", "a/a.txt", "b/b.txt", "c/c.txt")
 
-	(srcdir / "root.txt").touch()
-
-	(srcdir / 'a').mkdir()
-	(srcdir / 'a' / "a.txt").touch()
-	(srcdir / 'b').mkdir()
-	(srcdir / 'b' / "b.txt").touch()
-	(srcdir / 'c').mkdir()
-	(srcdir / 'c' / "c.txt").touch()
-
-	assert (srcdir / "root.txt").exists()
-	assert (srcdir / "root.txt").is_file()
-	assert (srcdir / 'a').exists()
-	assert (srcdir / 'a').is_dir()
-	assert (srcdir / 'a' / "a.txt").exists()
-	assert (srcdir / 'a' / "a.txt").is_file()
-	assert (srcdir / 'b').exists()
-	assert (srcdir / 'b').is_dir()
-	assert (srcdir / 'b' / "b.txt").exists()
-	assert (srcdir / 'b' / "b.txt").is_file()
-	assert (srcdir / 'c').exists()
-	assert (srcdir / 'c').is_dir()
-	assert (srcdir / 'c' / "c.txt").exists()
-	assert (srcdir / 'c' / "c.txt").is_file()
 
-	destdir = tmp_pathplus / "dest"
-	destdir.mkdir()
+def _make_tree(root: PathPlus, filenames: Iterable[str]) -> None:
+	for filename in filenames:
+		(root / filename).parent.maybe_make(parents=True)
+		(root / filename).touch()
+
 
-	copytree(srcdir, destdir)
+def _list_tree(root: PathPlus) -> List[Tuple[str, bool]]:
+	"""
+	Returns a sorted list of ``(relative path, is directory)`` for everything below ``root``.
+	"""
 
-	assert set(os.listdir(srcdir)) == set(os.listdir(destdir))
+	tree = []
 
-	assert (destdir / "root.txt").exists()
-	assert (destdir / "root.txt").is_file()
-	assert (destdir / 'a').exists()
-	assert (destdir / 'a').is_dir()
-	assert (destdir / 'a' / "a.txt").exists()
-	assert (destdir / 'a' / "a.txt").is_file()
-	assert (destdir / 'b').exists()
-	assert (destdir / 'b').is_dir()
-	assert (destdir / 'b' / "b.txt").exists()
-	assert (destdir / 'b' / "b.txt").is_file()
-	assert (destdir / 'c').exists()
-	assert (destdir / 'c').is_dir()
-	assert (destdir / 'c' / "c.txt").exists()
-	assert (destdir / 'c' / "c.txt").is_file()
+	for dirpath, dirnames, filenames in os.walk(root):
+		relative_dir = PathPlus(dirpath).relative_to(root)
+		tree.extend(((relative_dir / name).as_posix(), True) for name in dirnames)
+		tree.extend(((relative_dir / name).as_posix(), False) for name in filenames)
 
+	return sorted(tree)
 
-def test_copytree_exists(tmp_pathplus):
+
+@pytest.mark.parametrize("path_type", [str, pathlib.Path, PathPlus])
+def test_copytree(tmp_pathplus, path_type: Type):
 	srcdir = tmp_pathplus / "src"
 	srcdir.mkdir()
-
-	(srcdir / "root.txt").touch()
-	(srcdir / 'a').mkdir()
-	(srcdir / 'a' / "a.txt").touch()
-	(srcdir / 'b').mkdir()
-	(srcdir / 'b' / "b.txt").touch()
-	(srcdir / 'c').mkdir()
-	(srcdir / 'c' / "c.txt").touch()
-
-	assert (srcdir / "root.txt").exists()
-	assert (srcdir / "root.txt").is_file()
-	assert (srcdir / 'a').exists()
-	assert (srcdir / 'a').is_dir()
-	assert (srcdir / 'a' / "a.txt").exists()
-	assert (srcdir / 'a' / "a.txt").is_file()
-	assert (srcdir / 'b').exists()
-	assert (srcdir / 'b').is_dir()
-	assert (srcdir / 'b' / "b.txt").exists()
-	assert (srcdir / 'b' / "b.txt").is_file()
-	assert (srcdir / 'c').exists()
-	assert (srcdir / 'c').is_dir()
-	assert (srcdir / 'c' / "c.txt").exists()
-	assert (srcdir / 'c' / "c.txt").is_file()
+	_make_tree(srcdir, _copytree_files)
+
+	assert _list_tree(srcdir) == [
+			('a', True),
+			("a/a.txt", False),
+			('b', True),
+			("b/b.txt", False),
+			('c', True),
+			("c/c.txt", False),
+			("root.txt", False),
+			]
 
 	destdir = tmp_pathplus / "dest"
 	destdir.mkdir()
 
-	copytree(srcdir, destdir)
-
-	assert set(os.listdir(srcdir)) == set(os.listdir(destdir))
+	assert copytree(path_type(srcdir), path_type(destdir)) == path_type(destdir)
 
-	assert (destdir / "root.txt").exists()
-	assert (destdir / "root.txt").is_file()
-	assert (destdir / 'a').exists()
-	assert (destdir / 'a').is_dir()
-	assert (destdir / 'a' / "a.txt").exists()
-	assert (destdir / 'a' / "a.txt").is_file()
-	assert (destdir / 'b').exists()
-	assert (destdir / 'b').is_dir()
-	assert (destdir / 'b' / "b.txt").exists()
-	assert (destdir / 'b' / "b.txt").is_file()
-	assert (destdir / 'c').exists()
-	assert (destdir / 'c').is_dir()
-	assert (destdir / 'c' / "c.txt").exists()
-	assert (destdir / 'c' / "c.txt").is_file()
+	assert _list_tree(destdir) == _list_tree(srcdir)
 
 
 @pytest.mark.xfail(
@@ -467,29 +367,7 @@ def test_copytree_exists(tmp_pathplus):
 def test_copytree_exists_stdlib(tmp_pathplus):
 	srcdir = tmp_pathplus / "src"
 	srcdir.mkdir()
-
-	(srcdir / "root.txt").touch()
-	(srcdir / 'a').mkdir()
-	(srcdir / 'a' / "a.txt").touch()
-	(srcdir / 'b').mkdir()
-	(srcdir / 'b' / "b.txt").touch()
-	(srcdir / 'c').mkdir()
-	(srcdir / 'c' / "c.txt").touch()
-
-	assert (srcdir / "root.txt").exists()
-	assert (srcdir / "root.txt").is_file()
-	assert (srcdir / 'a').exists()
-	assert (srcdir / 'a').is_dir()
-	assert (srcdir / 'a' / "a.txt").exists()
-	assert (srcdir / 'a' / "a.txt").is_file()
-	assert (srcdir / 'b').exists()
-	assert (srcdir / 'b').is_dir()
-	assert (srcdir / 'b' / "b.txt").exists()
-	assert (srcdir / 'b' / "b.txt").is_file()
-	assert (srcdir / 'c').exists()
-	assert (srcdir / 'c').is_dir()
-	assert (srcdir / 'c' / "c.txt").exists()
-	assert (srcdir / 'c' / "c.txt").is_file()
+	_make_tree(srcdir, _copytree_files)
 
 	destdir = tmp_pathplus / "dest"
 	destdir.mkdir()
@@ -830,12 +708,76 @@ def test_iterchildren_no_exclusions(tmp_pathplus: PathPlus):
 				("**/.tox/*", "foo/bar/.tox/build", True),
 				("**/.tox/**", "foo/bar/.tox/build", True),
 				("**/.tox/**", "foo/bar/.tox/build/baz", True),
+				("**/*", "foo/bar.py", True),
+				("foo/*", "foo", False),
+				("foo/**/bar/baz.py", "foo/bar/qux/bar/baz.py", True),
+				("foo/**/**/*.py", "foo/bar/baz.py", True),
+				("foo/**/**/*.py", "foo/bar/baz.txt", False),
+				("[!]a]", 'b', True),
+				("[!]a]", ']', False),
+				("[z-a]", 'z', False),
+				("x[z-a]y", "xay", False),
+				("[!z-a]", 'q', True),
+				("[a-]", '-', True),
 				]
 		)
 def test_matchglob(pattern: str, filename: str, match: bool):
 	assert matchglob(filename, pattern) is match
 
 
+def test_matchglob_pathological():
+	# These would take minutes to fail with a naive backtracking regular expression.
+	filename = '/'.join(['a' * 80] * 80) + "/y.py"
+	assert not matchglob(filename, "**/*a*a*a*a*a*/x.py")
+	assert not matchglob(filename, "**/*a*a*a*a*a*/**/*a*a*a*a*a*/x.py")
+
+	filename = '/'.join(['a'] * 120) + "/y"
+	assert not matchglob(filename, '/'.join(["**", 'a'] * 6) + "/x")
+	assert not matchglob(filename, '/'.join(["**", "*a*"] * 20) + "/x")
+
+	filename = '/'.join(['a'] * 200) + "/y"
+	for n_recursive in (1, 5, 10, 25):
+		assert not matchglob(filename, '/'.join(["**", 'a'] * n_recursive) + "/x")
+
+
+@pytest.mark.parametrize(
+		"pattern, cases",
+		[
+				(
+						"domdf_python_tools/**/*.py",
+						[
+								("domdf_python_tools/testing/selectors.c", False),
+								("domdf_python_tools/foo/bar/baz.py", True),
+								("domdf_python_tools/words.py", True),
+								("demo.py", False),
+								],
+						),
+				(
+						"domdf_python_tools/[!abc].py",
+						[
+								("domdf_python_tools/d.py", True),
+								("domdf_python_tools/a.py", False),
+								],
+						),
+				(
+						"**/.tox/**",
+						[
+								("foo/bar/.tox", True),
+								("foo/bar/.tox/build", True),
+								("foo/bar/.toxic/build", False),
+								],
+						),
+				]
+		)
+def test_compile_glob(pattern: str, cases):
+	matcher = compile_glob(pattern)
+
+	for filename, match in cases:
+		assert matcher(filename) is match
+		assert matcher(PathPlus(filename)) is match
+		assert matchglob(filename, pattern) is match
+
+
 pypy_no_symlink = pytest.mark.skipif(
 		condition=PYPY and platform.system() == "Windows",
 		reason="symlink() is not implemented for PyPy on Windows",
@@ -119,6 +119,19 @@ def test_overtype(capsys):
 	stderr = captured.err.split('\n')
 	assert stderr == ["Waiting...\rfoo bar"]
 
+	print("Waiting...", end='')
+	overtype()
+	sys.stdout.flush()
+
+	captured = capsys.readouterr()
+	assert captured.out == "Waiting...\r"
+
+
+def test_overtype_no_stdout(monkeypatch):
+	monkeypatch.setattr(sys, "stdout", None)
+	overtype("foo", "bar")
+	overtype()
+
 
 def test_echo(capsys):
 	with Echo():